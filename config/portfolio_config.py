@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-ENERGY_KEYWORDS = [
+ENERGY_KEYWORDS = (
     "smart grid",
     "energy",
     "energy storage",
     "industrial efficiency",
-]
+)
 
 EIP_PORTFOLIO_URLS = ["https://www.energyimpactpartners.com/_portfolio/"]
 SET_PORTFOLIO_URLS = ["https://www.setventures.com/portfolio/"]
@@ -15,13 +15,23 @@ SET_LOCAL_HTML = "data/setventures.html"
 GEMINI_API_KEY_ENV = "GEMINI_API_KEY"
 GEMINI_MODEL = "gemini-3-flash-preview"
 LLM_HTML_CHAR_LIMIT = 120000
+LLM_CACHE_ENV = "HITACHI_LLM_CACHE"
+LLM_CACHE_DIR = ".cache/gemini"
 
 LOG_LEVEL_ENV = "HITACHI_LOG_LEVEL"
 LOG_LEVEL_DEFAULT = "INFO"
 
+FAST_HTML_PARSER_ENV = "HITACHI_FAST_HTML"
+DISABLE_PREWARM_ENV = "HITACHI_DISABLE_PREWARM"
+
 REQUEST_HEADERS = {
     "User-Agent": "Mozilla/5.0 (compatible; HitachiPortfolioBot/1.0; +https://example.com/bot)",
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
     "Accept-Language": "en-US,en;q=0.8",
 }
 HTTP_TIMEOUT_SECONDS = 15
+HTTP_POOL_CONNECTIONS = 10
+HTTP_POOL_MAXSIZE = 20
+HTTP_STREAM_CHUNK_BYTES = 32768
+PROFILE_FETCH_CONCURRENCY = 8
+SCRAPE_CONCURRENCY = 8
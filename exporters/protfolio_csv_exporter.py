@@ -10,13 +10,13 @@ def protfolio_csv_exporter(companies: Iterable[Company], output_path: str) -> No
     with open(output_path, "w", newline="", encoding="utf-8") as handle:
         writer = csv.writer(handle)
         writer.writerow(["company_name", "website", "description", "source", "last_round"])
-        for company in companies:
-            writer.writerow(
-                [
-                    company.name,
-                    company.website,
-                    company.description,
-                    company.source,
-                    getattr(company.last_round, "value", company.last_round),
-                ]
+        writer.writerows(
+            (
+                company.name,
+                company.website,
+                company.description,
+                company.source,
+                getattr(company.last_round, "value", company.last_round),
             )
+            for company in companies
+        )
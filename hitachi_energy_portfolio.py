@@ -11,7 +11,8 @@ from __future__ import annotations
 import logging
 import os
 import sys
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
 
 from config.portfolio_config import (
     EIP_LOCAL_HTML,
@@ -22,26 +23,28 @@ from config.portfolio_config import (
     SET_PORTFOLIO_URLS,
 )
 from services.portfolio_enrichment import (
-    enrich_from_vc_profile,
-    enrich_round,
-    fill_missing_fields,
+    enrich_all,
     load_enrichment_map,
     mock_portfolio_data,
 )
-from services.portfolio_filtering import filter_relevant, is_relevant
+from services.portfolio_enrichment_async import enrich_from_vc_profiles
+from services.portfolio_filtering import filter_relevant
 from models.portfolio_models import Company
 from exporters.protfolio_csv_exporter import protfolio_csv_exporter
-from services.portfolio_scraper import scrape_portfolio
+from services.portfolio_scraper import prewarm_dns, scrape_portfolio, scrape_portfolios
 
 
-def scrape_portfolios(urls: List[str], source: str, fallback: List[Company]) -> List[Company]:
-    companies: List[Company] = []
-    for url in urls:
-        companies.extend(scrape_portfolio(url, source, []))
-    return companies or fallback
+def collect(results: Dict[Tuple[str, str], List[Company]], urls: List[str], source: str) -> List[Company]:
+    return [company for url in urls for company in results[(url, source)]]
 
 
 def main() -> int:
+    use_mock = "--use-mock" in sys.argv
+    no_filter = "--no-filter" in sys.argv
+    if not use_mock:
+        # Start first so the lookups overlap with logging, mock and enrichment setup.
+        prewarm_dns(EIP_PORTFOLIO_URLS + SET_PORTFOLIO_URLS)
+
     log_level_name = os.getenv(LOG_LEVEL_ENV, LOG_LEVEL_DEFAULT).upper()
     log_level = getattr(logging, log_level_name, logging.INFO)
     logging.basicConfig(
@@ -49,44 +52,43 @@ def main() -> int:
         format="%(asctime)s %(levelname)s %(name)s %(message)s",
     )
 
-    use_mock = "--use-mock" in sys.argv
-    no_filter = "--no-filter" in sys.argv
-
     mock_data = mock_portfolio_data()
-    mock_lookup = {c.name.lower(): c for companies in mock_data.values() for c in companies}
+    mock_lookup = {c.name_key: c for companies in mock_data.values() for c in companies}
     enrichment_map = load_enrichment_map()
 
     if use_mock:
         eip_companies = mock_data["EIP"]
         set_companies = mock_data["SET"]
     else:
-        eip_companies = scrape_portfolios(EIP_PORTFOLIO_URLS, "EIP", [])
+        # Fetch every live portfolio page in one concurrent batch.
+        results = scrape_portfolios(
+            [(url, "EIP", []) for url in EIP_PORTFOLIO_URLS]
+            + [(url, "SET", []) for url in SET_PORTFOLIO_URLS]
+        )
+
+        eip_companies = collect(results, EIP_PORTFOLIO_URLS, "EIP")
         if not eip_companies and EIP_LOCAL_HTML:
-            eip_companies = scrape_portfolios([EIP_LOCAL_HTML], "EIP", mock_data["EIP"])
+            eip_companies = scrape_portfolio(EIP_LOCAL_HTML, "EIP", mock_data["EIP"])
         elif not eip_companies:
             eip_companies = mock_data["EIP"]
 
-        set_companies = scrape_portfolios(SET_PORTFOLIO_URLS, "SET", [])
+        set_companies = collect(results, SET_PORTFOLIO_URLS, "SET")
         if not set_companies and SET_LOCAL_HTML:
-            set_companies = scrape_portfolios([SET_LOCAL_HTML], "SET", mock_data["SET"])
+            set_companies = scrape_portfolio(SET_LOCAL_HTML, "SET", mock_data["SET"])
         elif not set_companies:
             set_companies = mock_data["SET"]
 
     all_companies = eip_companies + set_companies
 
-    enriched: List[Company] = []
-    for company in all_companies:
-        company = enrich_from_vc_profile(company)
-        company = fill_missing_fields(company, mock_lookup)
-        company = enrich_round(company, enrichment_map)
-        enriched.append(company)
+    enrich_from_vc_profiles(all_companies)
 
-    protfolio_csv_exporter(enriched, "all_companies_enriched.csv")
+    enriched = enrich_all(all_companies, mock_lookup, enrichment_map)
 
-    if no_filter:
-        relevant = enriched
-    else:
-        relevant = filter_relevant(enriched)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # The bulk LLM filter is network-bound; write the full export while it runs.
+        relevant_future = None if no_filter else executor.submit(filter_relevant, enriched)
+        protfolio_csv_exporter(enriched, "all_companies_enriched.csv")
+        relevant = enriched if relevant_future is None else relevant_future.result()
 
     output_path = "hitachi_relevant_companies.csv"
     protfolio_csv_exporter(relevant, output_path)
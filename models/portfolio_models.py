@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import List, Optional
 
@@ -19,7 +19,7 @@ class RoundStage(str, Enum):
     UNKNOWN = "Unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class Company:
     name: str
     website: str
@@ -29,3 +29,8 @@ class Company:
     energy_keywords: Optional[List[str]] = None
     stage: str = ""
     profile_url: str = ""
+    name_key: str = field(init=False, default="", repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Lowercased once; used for all enrichment and mock lookups.
+        self.name_key = self.name.lower()
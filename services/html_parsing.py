@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import os
+from typing import Dict, Iterable, Optional
+
+from config.portfolio_config import FAST_HTML_PARSER_ENV
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as SelectolaxParser  # type: ignore
+except ImportError:
+    SelectolaxParser = None
+
+
+def use_fast_parser() -> bool:
+    # selectolax parses in C; HITACHI_FAST_HTML=0 forces the stdlib HTMLParser path.
+    return SelectolaxParser is not None and os.environ.get(FAST_HTML_PARSER_ENV, "1") != "0"
+
+
+def get_attrs(attrs: Iterable[tuple[str, Optional[str]]], *names: str) -> Dict[str, str]:
+    # Read only the requested attributes and stop once they are all found. The first
+    # occurrence of a duplicated attribute wins, as in browsers and selectolax. Both
+    # HTMLParser and selectolax already lowercase attribute names.
+    found = dict.fromkeys(names, "")
+    remaining = set(names)
+    for key, value in attrs:
+        if key in remaining:
+            found[key] = value or ""
+            remaining.discard(key)
+            if not remaining:
+                break
+    return found
@@ -1,16 +1,31 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import os
 import re
-from typing import List, Optional
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
 
-from config.portfolio_config import GEMINI_API_KEY_ENV, GEMINI_MODEL, LLM_HTML_CHAR_LIMIT
+from config.portfolio_config import (
+    GEMINI_API_KEY_ENV,
+    GEMINI_MODEL,
+    LLM_CACHE_DIR,
+    LLM_CACHE_ENV,
+    LLM_HTML_CHAR_LIMIT,
+)
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 _client: Optional["genai.Client"] = None
+# Keyed by _cache_key digests; holds only replies that parsed.
+_memory_cache: Dict[str, str] = {}
 
 
 def _get_client() -> Optional["genai.Client"]:
@@ -30,6 +45,73 @@ def _get_client() -> Optional["genai.Client"]:
     return _client
 
 
+def _json_loads(text: str) -> Any:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either.
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _json_dumps(value: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(value).decode("utf-8")
+    return json.dumps(value)
+
+
+def _cache_enabled() -> bool:
+    return os.environ.get(LLM_CACHE_ENV) == "1"
+
+
+def _cache_key(prompt: str) -> str:
+    return hashlib.sha256(f"{GEMINI_MODEL}\0{prompt}".encode("utf-8")).hexdigest()
+
+
+def _cache_path(key: str) -> Path:
+    return Path(LLM_CACHE_DIR) / key[:2] / key
+
+
+def _cache_get(key: str) -> Optional[str]:
+    # Validated replies stay in memory for the process; the disk layer is opt-in.
+    value = _memory_cache.get(key)
+    if value is not None or not _cache_enabled():
+        return value
+    try:
+        value = _cache_path(key).read_text(encoding="utf-8")
+    except OSError:
+        return None
+    _memory_cache[key] = value
+    return value
+
+
+def _cache_put(key: str, value: str) -> None:
+    _memory_cache[key] = value
+    if not _cache_enabled():
+        return
+    path = _cache_path(key)
+    tmp_path = path.with_name(f"{key}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(value, encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError as exc:
+        logger.warning("LLM cache write failed key=%s error=%s", key, exc)
+
+
+def _generate(prompt: str) -> str:
+    client = _get_client()
+    if not client:
+        raise RuntimeError("LLM client unavailable")
+    response = client.models.generate_content(
+        model=GEMINI_MODEL,
+        contents=prompt,
+    )
+    return response.text or ""
+
+
+def _bulk_item_key(description: str, keywords: Sequence[str]) -> str:
+    return _cache_key(f"bulk-filter\0{', '.join(keywords)}\0{description}")
+
+
 def gemini_healthcheck() -> bool:
     client = _get_client()
     if not client:
@@ -43,7 +125,7 @@ def gemini_healthcheck() -> bool:
         logger.warning("LLM healthcheck failed error=%s", exc)
         return False
     try:
-        parsed = json.loads(response.text or "")
+        parsed = _json_loads(response.text or "")
     except (TypeError, json.JSONDecodeError) as exc:
         logger.warning("LLM healthcheck parse failed error=%s raw_text=%s", exc, response.text)
         return False
@@ -66,109 +148,86 @@ def extract_company_names_with_gemini(html: str) -> List[str]:
         f"HTML:\n{trimmed_html}"
     )
     try:
-        response = client.models.generate_content(
-            model=GEMINI_MODEL,
-            contents=prompt,
-        )
+        cleaned = _extract_names(prompt)
     except Exception as exc:
         logger.warning("LLM extraction failed error=%s", exc)
         return []
-    raw_text = (response.text or "").strip()
-    if raw_text.startswith("```"):
-        raw_text = raw_text.strip("`")
-        raw_text = raw_text.replace("json", "", 1).strip()
-    try:
-        names = json.loads(raw_text)
-    except (TypeError, json.JSONDecodeError) as exc:
-        logger.warning("LLM response parse failed error=%s raw_text=%s", exc, response.text)
-        return []
-    if not isinstance(names, list):
-        logger.warning("LLM response not a list type=%s", type(names).__name__)
-        return []
-    cleaned = []
-    seen = set()
-    for name in names:
-        if not isinstance(name, str):
-            continue
-        cleaned_name = re.sub(r"\s+", " ", name).strip()
-        if 2 <= len(cleaned_name) <= 60:
-            key = cleaned_name.lower()
-            if key not in seen:
-                seen.add(key)
-                cleaned.append(cleaned_name)
     if cleaned:
         logger.info("LLM extracted %s names: %s", len(cleaned), ", ".join(cleaned))
     return cleaned
 
 
-def llm_matches_energy(description: str, keywords: List[str]) -> bool:
-    client = _get_client()
-    if not client:
-        return False
-    prompt = (
-        "Decide if the company description is relevant to energy investing. "
-        "Keywords: "
-        f"{', '.join(keywords)}. "
-        "Return a JSON boolean only.\n\n"
-        f"Description:\n{description}"
-    )
-    try:
-        response = client.models.generate_content(
-            model=GEMINI_MODEL,
-            contents=prompt,
-        )
-    except Exception as exc:
-        logger.warning("LLM filter failed error=%s", exc)
-        return False
-    raw_text = (response.text or "").strip()
+def _extract_names(prompt: str) -> List[str]:
+    key = _cache_key(prompt)
+    response_text = _cache_get(key)
+    if response_text is None:
+        response_text = _generate(prompt)
+    raw_text = response_text.strip()
     if raw_text.startswith("```"):
         raw_text = raw_text.strip("`")
         raw_text = raw_text.replace("json", "", 1).strip()
     try:
-        parsed = json.loads(raw_text)
+        names = _json_loads(raw_text)
     except (TypeError, json.JSONDecodeError) as exc:
-        logger.warning("LLM filter parse failed error=%s raw_text=%s", exc, response.text)
-        return False
-    if isinstance(parsed, bool):
-        return parsed
-    logger.warning("LLM filter response not boolean value=%s", parsed)
-    return False
+        raise ValueError(f"response parse failed: {exc} raw_text={response_text}") from exc
+    if not isinstance(names, list):
+        raise ValueError(f"response not a list type={type(names).__name__}")
+    normalized = [re.sub(r"\s+", " ", name).strip() for name in names if isinstance(name, str)]
+    # Case-insensitive dedup that keeps the first spelling seen, in order.
+    unique: Dict[str, str] = {}
+    for name in normalized:
+        if 2 <= len(name) <= 60:
+            unique.setdefault(name.lower(), name)
+    # Store only replies that parsed, so a malformed one is retried.
+    _cache_put(key, response_text)
+    return list(unique.values())
 
 
-def llm_filter_energy_bulk(descriptions: List[str], keywords: List[str]) -> List[bool]:
+def llm_filter_energy_bulk(descriptions: List[str], keywords: Sequence[str]) -> List[bool]:
     if not descriptions:
         return []
+    # Decisions are cached per description so partially overlapping runs still hit.
+    item_keys = [_bulk_item_key(description, keywords) for description in descriptions]
+    results: List[bool] = [False] * len(descriptions)
+    pending: List[int] = []
+    for index, key in enumerate(item_keys):
+        cached = _cache_get(key)
+        if cached is None:
+            pending.append(index)
+        else:
+            results[index] = cached == "true"
+    if not pending:
+        return results
     client = _get_client()
     if not client:
-        return [False] * len(descriptions)
+        return results
+    pending_descriptions = [descriptions[index] for index in pending]
     prompt = (
         "You will receive a JSON array of company descriptions. "
         "For each description, decide if it is relevant to energy investing. "
         f"Keywords: {', '.join(keywords)}. "
         "Return a JSON array of booleans with the same length and order, no extra text.\n\n"
-        f"Descriptions:\n{json.dumps(descriptions)}"
+        f"Descriptions:\n{_json_dumps(pending_descriptions)}"
     )
     try:
-        response = client.models.generate_content(
-            model=GEMINI_MODEL,
-            contents=prompt,
-        )
+        response_text = _generate(prompt)
     except Exception as exc:
         logger.warning("LLM bulk filter failed error=%s", exc)
-        return [False] * len(descriptions)
-    raw_text = (response.text or "").strip()
+        return results
+    raw_text = response_text.strip()
     if raw_text.startswith("```"):
         raw_text = raw_text.strip("`")
         raw_text = raw_text.replace("json", "", 1).strip()
     try:
-        parsed = json.loads(raw_text)
+        parsed = _json_loads(raw_text)
     except (TypeError, json.JSONDecodeError) as exc:
-        logger.warning("LLM bulk filter parse failed error=%s raw_text=%s", exc, response.text)
-        return [False] * len(descriptions)
-    if not isinstance(parsed, list) or len(parsed) != len(descriptions):
+        logger.warning("LLM bulk filter parse failed error=%s raw_text=%s", exc, response_text)
+        return results
+    if not isinstance(parsed, list) or len(parsed) != len(pending):
         logger.warning("LLM bulk filter unexpected response length=%s", len(parsed) if isinstance(parsed, list) else "n/a")
-        return [False] * len(descriptions)
-    results: List[bool] = []
-    for item in parsed:
-        results.append(bool(item) if isinstance(item, bool) else False)
+        return results
+    decisions = [item if isinstance(item, bool) else False for item in parsed]
+    for index, match in zip(pending, decisions):
+        results[index] = match
+        _cache_put(item_keys[index], "true" if match else "false")
     return results
@@ -1,17 +1,39 @@
 from __future__ import annotations
 
-import hashlib
 import logging
+import threading
 import urllib.error
 import urllib.request
+import zlib
+from collections import OrderedDict
 from html.parser import HTMLParser
 from typing import Dict, List, Optional
 
-from config.portfolio_config import HTTP_TIMEOUT_SECONDS, REQUEST_HEADERS
+from config.portfolio_config import (
+    HTTP_POOL_CONNECTIONS,
+    HTTP_POOL_MAXSIZE,
+    HTTP_TIMEOUT_SECONDS,
+    REQUEST_HEADERS,
+)
 from models.portfolio_models import Company, RoundStage
+from services.html_parsing import SelectolaxParser, get_attrs, use_fast_parser
 
 logger = logging.getLogger(__name__)
 
+_session: Optional["requests.Session"] = None
+_SESSION_LOCK = threading.Lock()
+_PROFILE_CACHE_MAXSIZE = 512
+_PROFILE_CACHE: "OrderedDict[str, tuple[str, str]]" = OrderedDict()
+_PROFILE_CACHE_LOCK = threading.Lock()
+
+_MOCK_ROUNDS = (
+    RoundStage.SEED,
+    RoundStage.SERIES_A,
+    RoundStage.SERIES_B,
+    RoundStage.SERIES_C,
+    RoundStage.SERIES_D,
+)
+
 
 def mock_portfolio_data() -> dict[str, List[Company]]:
     # Mocked entries used if scraping fails or for enrichment fallback.
@@ -77,26 +99,24 @@ def load_enrichment_map() -> Dict[str, RoundStage]:
     }
 
 
-def fill_missing_fields(company: Company, mock_map: dict[str, Company]) -> Company:
-    key = company.name.lower()
-    if key in mock_map:
-        mock = mock_map[key]
-        if not company.website:
-            company.website = mock.website
+def enrich_all(
+    companies: List[Company],
+    mock_map: dict[str, Company],
+    round_map: dict[str, RoundStage],
+) -> List[Company]:
+    # Single pass: mock field fill, then round lookup, hashing only when both lookups miss.
+    # Companies are updated in place, so no second list is built alongside the input.
+    for company in companies:
+        key = company.name_key
+        mock = mock_map.get(key)
+        if mock:
+            if not company.website:
+                company.website = mock.website
+            if company.last_round == RoundStage.UNKNOWN:
+                company.last_round = mock.last_round
         if company.last_round == RoundStage.UNKNOWN:
-            company.last_round = mock.last_round
-    return company
-
-
-def enrich_round(company: Company, round_map: dict[str, RoundStage]) -> Company:
-    if company.last_round != RoundStage.UNKNOWN:
-        return company
-    enriched = round_map.get(company.name.lower())
-    if enriched:
-        company.last_round = enriched
-    else:
-        company.last_round = _hash_round_stage(company.name)
-    return company
+            company.last_round = round_map.get(key) or _hash_round_stage(company.name)
+    return companies
 
 
 class _MetaDescriptionParser(HTMLParser):
@@ -108,20 +128,20 @@ class _MetaDescriptionParser(HTMLParser):
         self._in_paragraph = False
 
     def handle_starttag(self, tag: str, attrs: list[tuple[str, Optional[str]]]) -> None:
-        if tag.lower() == "meta":
-            attr_map = {k.lower(): (v or "") for k, v in attrs}
-            name = attr_map.get("name", "").lower()
-            prop = attr_map.get("property", "").lower()
-            content = attr_map.get("content", "").strip()
+        if tag == "meta":
+            attr_map = get_attrs(attrs, "name", "property", "content")
+            name = attr_map["name"].lower()
+            prop = attr_map["property"].lower()
+            content = attr_map["content"].strip()
             if name == "description" and content and not self.meta_description:
                 self.meta_description = content
             if prop == "og:description" and content and not self.og_description:
                 self.og_description = content
-        if tag.lower() == "p" and not self.first_paragraph:
+        if tag == "p" and not self.first_paragraph:
             self._in_paragraph = True
 
     def handle_endtag(self, tag: str) -> None:
-        if tag.lower() == "p":
+        if tag == "p":
             self._in_paragraph = False
 
     def handle_data(self, data: str) -> None:
@@ -135,7 +155,31 @@ class _MetaDescriptionParser(HTMLParser):
         return None
 
 
-def _fetch_vc_html(url: str) -> Optional[str]:
+def _get_session() -> Optional["requests.Session"]:
+    global _session
+    if _session is not None:
+        return _session
+    try:
+        import requests  # type: ignore
+        from requests.adapters import HTTPAdapter  # type: ignore
+    except ImportError:
+        return None
+    with _SESSION_LOCK:
+        if _session is None:
+            session = requests.Session()
+            session.headers.update(REQUEST_HEADERS)
+            # Keep-alive pool so profile pages on the same VC host reuse one TLS connection.
+            adapter = HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+    return _session
+
+
+def fetch_vc_html(url: str) -> Optional[str]:
+    session = _get_session()
+    if session is not None:
+        return _fetch_vc_html_session(session, url)
     request = urllib.request.Request(url, headers=REQUEST_HEADERS)
     try:
         with urllib.request.urlopen(request, timeout=HTTP_TIMEOUT_SECONDS) as response:
@@ -145,21 +189,30 @@ def _fetch_vc_html(url: str) -> Optional[str]:
         return None
 
 
+def _fetch_vc_html_session(session: "requests.Session", url: str) -> Optional[str]:
+    import requests  # type: ignore
+
+    try:
+        response = session.get(url, timeout=HTTP_TIMEOUT_SECONDS)
+    except requests.RequestException as exc:
+        logger.warning("VC page fetch failed url=%s error=%s", url, exc)
+        return None
+    if not response.ok:
+        logger.warning("VC page fetch failed url=%s status=%s", url, response.status_code)
+        return None
+    return response.content.decode("utf-8", errors="replace")
+
+
 class _ExternalLinkParser(HTMLParser):
     def __init__(self) -> None:
         super().__init__()
         self.first_external_link: str = ""
 
     def handle_starttag(self, tag: str, attrs: list[tuple[str, Optional[str]]]) -> None:
-        if tag.lower() != "a":
+        if self.first_external_link or tag != "a":
             return
-        attr_map = {k.lower(): (v or "") for k, v in attrs}
-        href = attr_map.get("href", "")
-        if not href or not href.startswith(("http://", "https://")):
-            return
-        if "setventures.com" in href:
-            return
-        if not self.first_external_link:
+        href = get_attrs(attrs, "href")["href"]
+        if _is_external_link(href):
             self.first_external_link = href
 
     def error(self, message: str) -> None:
@@ -171,9 +224,76 @@ def enrich_from_vc_profile(company: Company) -> Company:
         return company
     if not company.profile_url:
         return company
-    html = _fetch_vc_html(company.profile_url)
+    description, external_link = _fetch_and_parse(company.profile_url)
+    return apply_vc_profile(company, description, external_link)
+
+
+def _fetch_and_parse(url: str) -> tuple[str, str]:
+    profile = cached_vc_profile(url)
+    if profile is not None:
+        return profile
+    html = fetch_vc_html(url)
     if not html:
-        return company
+        return "", ""
+    return cache_vc_profile(url, html)
+
+
+def cached_vc_profile(url: str) -> Optional[tuple[str, str]]:
+    # Memoized by URL so a profile shared across sources is downloaded and parsed once.
+    with _PROFILE_CACHE_LOCK:
+        profile = _PROFILE_CACHE.get(url)
+        if profile is not None:
+            _PROFILE_CACHE.move_to_end(url)
+        return profile
+
+
+def cache_vc_profile(url: str, html: str) -> tuple[str, str]:
+    # Only fetched pages are stored; a failed fetch is retried on the next call.
+    profile = parse_vc_profile(html)
+    with _PROFILE_CACHE_LOCK:
+        _PROFILE_CACHE[url] = profile
+        if len(_PROFILE_CACHE) > _PROFILE_CACHE_MAXSIZE:
+            _PROFILE_CACHE.popitem(last=False)
+    return profile
+
+
+def _is_external_link(href: str) -> bool:
+    return href.startswith(("http://", "https://")) and "setventures.com" not in href
+
+
+def _extract_profile_fast(html: str) -> tuple[str, str]:
+    tree = SelectolaxParser(html)
+    meta_description = ""
+    og_description = ""
+    for node in tree.css("meta"):
+        attr_map = get_attrs(node.attributes.items(), "name", "property", "content")
+        content = attr_map["content"].strip()
+        if not content:
+            continue
+        if attr_map["name"].lower() == "description" and not meta_description:
+            meta_description = content
+        if attr_map["property"].lower() == "og:description" and not og_description:
+            og_description = content
+    description = meta_description or og_description
+    if not description:
+        for node in tree.css("p"):
+            text = node.text(deep=True, separator=" ", strip=True)
+            if text:
+                description = text
+                break
+    external_link = ""
+    for node in tree.css("a[href]"):
+        href = node.attributes.get("href") or ""
+        if _is_external_link(href):
+            external_link = href
+            break
+    return description, external_link
+
+
+def parse_vc_profile(html: str) -> tuple[str, str]:
+    # Returns (description, first external link) for a VC profile page.
+    if use_fast_parser():
+        return _extract_profile_fast(html)
     description_parser = _MetaDescriptionParser()
     description_parser.feed(html)
     description = (
@@ -181,26 +301,21 @@ def enrich_from_vc_profile(company: Company) -> Company:
         or description_parser.og_description
         or description_parser.first_paragraph
     )
+    link_parser = _ExternalLinkParser()
+    link_parser.feed(html)
+    return description, link_parser.first_external_link
+
+
+def apply_vc_profile(company: Company, description: str, external_link: str) -> Company:
     if description:
         company.description = description
-    if not company.website:
-        link_parser = _ExternalLinkParser()
-        link_parser.feed(html)
-        if link_parser.first_external_link:
-            company.website = link_parser.first_external_link
+    if external_link and not company.website:
+        company.website = external_link
     return company
 
 
 def _hash_round_stage(name: str) -> RoundStage:
-    rounds = [
-        RoundStage.SEED,
-        RoundStage.SERIES_A,
-        RoundStage.SERIES_B,
-        RoundStage.SERIES_C,
-        RoundStage.SERIES_D,
-    ]
     if not name:
         return RoundStage.SEED
-    digest = hashlib.sha256(name.lower().encode("utf-8")).hexdigest()
-    index = int(digest, 16) % len(rounds)
-    return rounds[index]
+    # Deterministic mock only; crc32 is plenty and far cheaper than a cryptographic hash.
+    return _MOCK_ROUNDS[zlib.crc32(name.lower().encode("utf-8")) % len(_MOCK_ROUNDS)]
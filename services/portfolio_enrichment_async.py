@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Dict, List, Optional
+
+from config.portfolio_config import HTTP_TIMEOUT_SECONDS, PROFILE_FETCH_CONCURRENCY, REQUEST_HEADERS
+from models.portfolio_models import Company
+from services.portfolio_enrichment import (
+    apply_vc_profile,
+    cache_vc_profile,
+    cached_vc_profile,
+    enrich_from_vc_profile,
+    fetch_vc_html,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _needs_profile(company: Company) -> bool:
+    return not company.description and bool(company.profile_url)
+
+
+async def _fetch_many_aiohttp(urls: List[str], max_concurrency: int) -> List[Optional[str]]:
+    import aiohttp  # type: ignore
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+    timeout = aiohttp.ClientTimeout(total=HTTP_TIMEOUT_SECONDS)
+    async with aiohttp.ClientSession(headers=REQUEST_HEADERS, timeout=timeout) as session:
+
+        async def fetch(url: str) -> Optional[str]:
+            async with semaphore:
+                try:
+                    async with session.get(url) as response:
+                        response.raise_for_status()
+                        return await response.text(encoding="utf-8", errors="replace")
+                except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                    logger.warning("VC page fetch failed url=%s error=%s", url, exc)
+                    return None
+
+        return await asyncio.gather(*(fetch(url) for url in urls))
+
+
+async def _fetch_many(urls: List[str], max_concurrency: int = PROFILE_FETCH_CONCURRENCY) -> List[Optional[str]]:
+    try:
+        import aiohttp  # type: ignore  # noqa: F401
+    except ImportError:
+        # No aiohttp: run the blocking urllib fetch on worker threads instead.
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(url: str) -> Optional[str]:
+            async with semaphore:
+                return await asyncio.to_thread(fetch_vc_html, url)
+
+        return await asyncio.gather(*(fetch(url) for url in urls))
+    return await _fetch_many_aiohttp(urls, max_concurrency)
+
+
+async def _enrich_pending(companies: List[Company], max_concurrency: int) -> None:
+    # Companies sharing a profile URL are fetched and parsed once.
+    urls = list(dict.fromkeys(company.profile_url for company in companies))
+    profiles: Dict[str, tuple[str, str]] = {}
+    missing: List[str] = []
+    for url in urls:
+        profile = cached_vc_profile(url)
+        if profile is None:
+            missing.append(url)
+        else:
+            profiles[url] = profile
+    if missing:
+        pages = await _fetch_many(missing, max_concurrency)
+        for url, html in zip(missing, pages):
+            if html:
+                profiles[url] = cache_vc_profile(url, html)
+    for company in companies:
+        profile = profiles.get(company.profile_url)
+        if profile:
+            apply_vc_profile(company, *profile)
+
+
+def enrich_from_vc_profiles(
+    companies: List[Company],
+    max_concurrency: int = PROFILE_FETCH_CONCURRENCY,
+) -> List[Company]:
+    pending = [company for company in companies if _needs_profile(company)]
+    if len(pending) <= 1:
+        for company in pending:
+            enrich_from_vc_profile(company)
+        return companies
+    logger.info("Fetching %s VC profile pages concurrency=%s", len(pending), max_concurrency)
+    asyncio.run(_enrich_pending(pending, max_concurrency))
+    return companies
@@ -1,19 +1,26 @@
 from __future__ import annotations
 
+import re
+
 from config.portfolio_config import ENERGY_KEYWORDS
 from models.portfolio_models import Company, RoundStage
-from services.llm_client import llm_filter_energy_bulk, llm_matches_energy
+from services.llm_client import llm_filter_energy_bulk
+
 
+EARLY_STAGE_ALLOWED = frozenset({RoundStage.SEED, RoundStage.SERIES_A, RoundStage.SERIES_B, RoundStage.SERIES_C})
+LATE_STAGE_BLOCKED = frozenset(
+    {
+        RoundStage.SERIES_D,
+        RoundStage.SERIES_E,
+        RoundStage.SERIES_F,
+        RoundStage.SERIES_G,
+        RoundStage.IPO,
+        RoundStage.PUBLIC,
+    }
+)
 
-EARLY_STAGE_ALLOWED = {RoundStage.SEED, RoundStage.SERIES_A, RoundStage.SERIES_B, RoundStage.SERIES_C}
-LATE_STAGE_BLOCKED = {
-    RoundStage.SERIES_D,
-    RoundStage.SERIES_E,
-    RoundStage.SERIES_F,
-    RoundStage.SERIES_G,
-    RoundStage.IPO,
-    RoundStage.PUBLIC,
-}
+# One alternation scanned by the C regex engine instead of a substring pass per keyword.
+_KEYWORD_RE = re.compile("|".join(map(re.escape, ENERGY_KEYWORDS)), re.IGNORECASE)
 
 
 def is_round_eligible(round_stage: RoundStage) -> bool:
@@ -25,8 +32,7 @@ def is_round_eligible(round_stage: RoundStage) -> bool:
 
 
 def matches_energy_keywords(text: str) -> bool:
-    lowered = text.lower()
-    return any(keyword in lowered for keyword in ENERGY_KEYWORDS)
+    return _KEYWORD_RE.search(text) is not None
 
 
 def is_relevant(company: Company) -> bool:
@@ -34,10 +40,11 @@ def is_relevant(company: Company) -> bool:
         return False
     if not company.description:
         return False
-    return llm_matches_energy(company.description, ENERGY_KEYWORDS)
+    return matches_energy_keywords(company.description)
 
 
 def filter_relevant(companies: list[Company]) -> list[Company]:
+    keyword_indices: list[int] = []
     eligible_indices: list[int] = []
     descriptions: list[str] = []
     for index, company in enumerate(companies):
@@ -45,15 +52,24 @@ def filter_relevant(companies: list[Company]) -> list[Company]:
             continue
         if not company.description:
             continue
+        # A direct keyword hit is already a yes; only ambiguous descriptions need the LLM.
+        if matches_energy_keywords(company.description):
+            keyword_indices.append(index)
+            continue
         eligible_indices.append(index)
         descriptions.append(company.description)
 
     if not descriptions:
-        return []
-
-    matches = llm_filter_energy_bulk(descriptions, ENERGY_KEYWORDS)
-    relevant: list[Company] = []
-    for idx, match in zip(eligible_indices, matches):
-        if match:
-            relevant.append(companies[idx])
-    return relevant
+        return [companies[idx] for idx in keyword_indices]
+
+    # Send each distinct description once and fan the decisions back out.
+    unique_index: dict[str, int] = {}
+    unique_descriptions: list[str] = []
+    for description in descriptions:
+        if description not in unique_index:
+            unique_index[description] = len(unique_descriptions)
+            unique_descriptions.append(description)
+    decisions = llm_filter_energy_bulk(unique_descriptions, ENERGY_KEYWORDS)
+    matches = [decisions[unique_index[description]] for description in descriptions]
+    relevant_indices = keyword_indices + [idx for idx, match in zip(eligible_indices, matches) if match]
+    return [companies[idx] for idx in sorted(relevant_indices)]
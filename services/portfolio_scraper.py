@@ -1,136 +1,406 @@
 from __future__ import annotations
 
+import codecs
+import dataclasses
+import functools
+import hashlib
+import io
 import logging
+import os
 import re
+import socket
+import threading
 import time
 import urllib.error
 import urllib.request
 from urllib.parse import unquote, urlparse
 from pathlib import Path
+from html import unescape
 from html.parser import HTMLParser
-from typing import List, Optional
-
-from config.portfolio_config import HTTP_TIMEOUT_SECONDS, REQUEST_HEADERS
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional
+
+from config.portfolio_config import (
+    DISABLE_PREWARM_ENV,
+    HTTP_POOL_CONNECTIONS,
+    HTTP_POOL_MAXSIZE,
+    HTTP_STREAM_CHUNK_BYTES,
+    HTTP_TIMEOUT_SECONDS,
+    REQUEST_HEADERS,
+    SCRAPE_CONCURRENCY,
+)
 from models.portfolio_models import Company, RoundStage
+from services.html_parsing import SelectolaxParser, get_attrs, use_fast_parser
+
+try:
+    import re2  # type: ignore
+except ImportError:
+    re2 = re
 
 logger = logging.getLogger(__name__)
 
+_pool: Optional["urllib3.PoolManager"] = None
+_POOL_LOCK = threading.Lock()
+
+_ALLOWED_SCHEMES = ("http://", "https://")
+# Collapsing whitespace only shrinks text; anchors longer than this are boilerplate
+# even allowing for indentation, so they skip the split/join entirely.
+_RAW_ANCHOR_MAX = 300
+# Netloc characters urlparse treats specially (userinfo, IPv6, zone ids, stripped
+# whitespace); any of them sends _parse_host down the urlparse path.
+_NETLOC_SLOW_RE = re.compile(r"[@\[\]%\x00-\x20\x7f]")
+
+_SCRAPE_CACHE_MAXSIZE = 64
+_SCRAPE_CACHE: "OrderedDict[tuple[str, str], tuple[Company, ...]]" = OrderedDict()
+_SCRAPE_CACHE_LOCK = threading.Lock()
+
+# Single-slot (forgetful) memo for infer_company_name: ((description, website), name).
+_LAST_INFER: Optional[tuple[tuple[str, str], str]] = None
+
+# Name inference runs on every description; RE2 (google-re2 / pyre2) matches in linear
+# time with no backtracking. Both patterns are RE2-compatible; stdlib re is the fallback.
+_NAME_POSSESSIVE_RE = re2.compile(r"^([A-Z][A-Za-z0-9&.+-]*(?:\s+[A-Z][A-Za-z0-9&.+-]*){0,3})[’']s\b")
+_NAME_VERB_RE = re2.compile(
+    r"\b([A-Z][A-Za-z0-9&.+-]*(?:\s+[A-Z][A-Za-z0-9&.+-]*){0,3})\s+(is|are|provides|develops|builds|offers|delivers|enables)\b"
+)
+
+# Elements whose content HTML5 parsers (selectolax included) read as plain text, so an
+# "<a>" inside them is not a link.
+_RAW_TEXT_ELEMENTS = ("script", "style", "textarea", "title", "xmp", "iframe", "noembed", "noframes", "plaintext")
+
+# Generic-page fast path: an anchor with a quoted href and plain text only.
+_A_ATTRS = r"""(?:[^>"']|"[^"]*"|'[^']*')*?"""
+_A_RE = re.compile(
+    rf"""<a\s(?:{_A_ATTRS}\s)?href=["']([^"']+)["']{_A_ATTRS}>([^<]{{1,120}})</a>""",
+    re.IGNORECASE,
+)
+# Every start tag with its attributes, quoted values kept whole, to count real <a> tags.
+_START_TAG_RE = re.compile(r"""<([A-Za-z][^\s/>"'<]*)((?:[^>"']|"[^"]*"|'[^']*')*)>""")
+# Comments and raw-text elements can hold "<a ...>" that no parser treats as a link.
+# Well-formed regions are cut out before the scan; anything left over, <plaintext> or
+# <template> (whose content selectolax does not search) sends the page to the parser.
+_CLOSED_RAW_TEXT = "|".join(name for name in _RAW_TEXT_ELEMENTS if name != "plaintext")
+_A_SKIP_RE = re.compile(
+    rf"<!--(?!-?>).*?(?<!<!)-->|<({_CLOSED_RAW_TEXT})(?=[\s/>]).*?</\1\s*>",
+    re.IGNORECASE | re.DOTALL,
+)
+_A_BAIL_RE = re.compile(
+    rf"<!--|--!>|<!\[CDATA\[|<(?:{'|'.join(_RAW_TEXT_ELEMENTS)}|template)(?=[\s/>])",
+    re.IGNORECASE,
+)
 
 class AnchorTextParser(HTMLParser):
+    CDATA_CONTENT_ELEMENTS = _RAW_TEXT_ELEMENTS
+
     def __init__(self) -> None:
         super().__init__()
-        self.in_anchor = False
+        self.in_anchor: bool = False
+        # <template> content is a separate fragment that selectolax does not search.
+        self._template_depth: int = 0
+        self._text: List[str] = []
         self.anchors: List[str] = []
 
+    def _emit(self) -> None:
+        # One entry per anchor, nested text joined the way selectolax's text() does.
+        text = " ".join(self._text).strip()
+        self._text = []
+        self.in_anchor = False
+        if text:
+            self.anchors.append(text)
+
     def handle_starttag(self, tag: str, attrs: List[tuple[str, Optional[str]]]) -> None:
-        if tag.lower() == "a":
+        if tag == "template":
+            self._template_depth += 1
+        elif tag == "a" and not self._template_depth:
+            if self.in_anchor:
+                self._emit()
             self.in_anchor = True
 
     def handle_endtag(self, tag: str) -> None:
-        if tag.lower() == "a":
-            self.in_anchor = False
+        if tag == "template" and self._template_depth:
+            self._template_depth -= 1
+        elif tag == "a" and self.in_anchor:
+            self._emit()
 
     def handle_data(self, data: str) -> None:
+        if self.in_anchor and not self._template_depth:
+            self._text.append(data.strip())
+
+    def close(self) -> None:
+        super().close()
         if self.in_anchor:
-            text = data.strip()
-            if text:
-                self.anchors.append(text)
+            self._emit()
 
 
 class AnchorLinkParser(HTMLParser):
+    CDATA_CONTENT_ELEMENTS = _RAW_TEXT_ELEMENTS
+
     def __init__(self) -> None:
         super().__init__()
-        self.in_anchor = False
+        self.in_anchor: bool = False
+        # <template> content is a separate fragment that selectolax does not search.
+        self._template_depth: int = 0
         self.current_href: Optional[str] = None
+        self._text: List[str] = []
         self.links: List[tuple[str, str]] = []
 
+    def _emit(self) -> None:
+        text = " ".join(self._text).strip()
+        self._text = []
+        self.in_anchor = False
+        if text and self.current_href:
+            self.links.append((text, self.current_href))
+        self.current_href = None
+
     def handle_starttag(self, tag: str, attrs: List[tuple[str, Optional[str]]]) -> None:
-        if tag.lower() == "a":
+        if tag == "template":
+            self._template_depth += 1
+        elif tag == "a" and not self._template_depth:
+            if self.in_anchor:
+                self._emit()
             self.in_anchor = True
-            href = ""
-            for key, value in attrs:
-                if key.lower() == "href" and value:
-                    href = value
-                    break
-            self.current_href = href
+            self.current_href = get_attrs(attrs, "href")["href"]
 
     def handle_endtag(self, tag: str) -> None:
-        if tag.lower() == "a":
-            self.in_anchor = False
-            self.current_href = None
+        if tag == "template" and self._template_depth:
+            self._template_depth -= 1
+        elif tag == "a" and self.in_anchor:
+            self._emit()
 
     def handle_data(self, data: str) -> None:
-        if self.in_anchor and self.current_href:
-            text = data.strip()
-            if text:
-                self.links.append((text, self.current_href))
+        if self.in_anchor and not self._template_depth:
+            self._text.append(data.strip())
 
+    def close(self) -> None:
+        super().close()
+        if self.in_anchor:
+            self._emit()
 
-def fetch_html(url: str) -> Optional[str]:
-    if url.startswith("file://"):
-        parsed = urlparse(url)
-        local_path = Path(unquote(parsed.path))
+
+def _get_pool() -> Optional["urllib3.PoolManager"]:
+    global _pool
+    if _pool is not None:
+        return _pool
+    try:
+        import urllib3  # type: ignore
+    except ImportError:
+        return None
+    with _POOL_LOCK:
+        if _pool is None:
+            # Keep-alive pool so repeat fetches to the same VC host skip the TCP/TLS handshake.
+            _pool = urllib3.PoolManager(
+                num_pools=HTTP_POOL_CONNECTIONS,
+                maxsize=HTTP_POOL_MAXSIZE,
+                headers=REQUEST_HEADERS,
+                timeout=urllib3.Timeout(connect=HTTP_TIMEOUT_SECONDS, read=HTTP_TIMEOUT_SECONDS),
+                # Match urllib: follow redirects, but fail fast instead of retrying.
+                retries=urllib3.Retry(connect=0, read=0, redirect=10),
+            )
+    return _pool
+
+
+def prewarm_dns(urls: List[str]) -> None:
+    # Resolve source hosts in the background so the lookup overlaps with local setup
+    # instead of sitting in front of the first request to each host. This only helps
+    # when the system resolver caches answers (systemd-resolved, nscd, dnsmasq).
+    if os.getenv(DISABLE_PREWARM_ENV) == "1":
+        return
+    targets: set[tuple[str, int]] = set()
+    for url in urls:
+        parts = urlparse(url)
+        if not parts.hostname:
+            continue
         try:
-            body = local_path.read_bytes()
-        except OSError as exc:
-            logger.warning("Local file read failed url=%s error=%s", url, exc)
-            return None
-        logger.info("Loaded local HTML url=%s bytes=%s", url, len(body))
-        return body.decode("utf-8", errors="replace")
+            port = parts.port or (80 if parts.scheme == "http" else 443)
+        except ValueError:
+            continue
+        targets.add((parts.hostname, port))
+    if targets:
+        threading.Thread(target=_resolve_hosts, args=(sorted(targets),), daemon=True).start()
 
-    local_path = Path(url)
-    if local_path.exists():
+
+def _resolve_hosts(targets: List[tuple[str, int]]) -> None:
+    for host, port in targets:
         try:
-            body = local_path.read_bytes()
-        except OSError as exc:
-            logger.warning("Local file read failed path=%s error=%s", local_path, exc)
-            return None
-        logger.info("Loaded local HTML path=%s bytes=%s", local_path, len(body))
-        return body.decode("utf-8", errors="replace")
+            socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        except OSError:
+            logger.debug("DNS prewarm failed host=%s", host)
+
+
+def _log_http_error(url: str, status: int, reason: str, elapsed: float, snippet: bytes) -> None:
+    logger.warning(
+        "HTTP fetch failed url=%s status=%s reason=%s seconds=%s body_snippet=%s",
+        url,
+        status,
+        reason,
+        round(elapsed, 2),
+        snippet.decode("utf-8", errors="replace"),
+    )
+
+
+def _log_fetched(url: str, status: int, size: int, elapsed: float) -> None:
+    logger.info(
+        "Fetched HTML url=%s status=%s bytes=%s seconds=%s",
+        url,
+        status,
+        size,
+        round(elapsed, 2),
+    )
+
+
+def _read_remote_pooled(
+    pool: "urllib3.PoolManager", url: str, sink: Callable[[bytes], None], chunk_size: int
+) -> bool:
+    import urllib3  # type: ignore
+
+    start = time.monotonic()
+    try:
+        response = pool.request("GET", url, preload_content=False)
+        try:
+            if response.status >= 400:
+                snippet = response.read(500)
+                # Discard the rest of the body so the keep-alive connection goes back clean.
+                response.drain_conn()
+                _log_http_error(url, response.status, response.reason, time.monotonic() - start, snippet)
+                return False
+            size = 0
+            for chunk in response.stream(chunk_size):
+                size += len(chunk)
+                sink(chunk)
+        except BaseException:
+            # A partly read body would leak into the next request on this connection.
+            response.close()
+            raise
+        finally:
+            response.release_conn()
+    except urllib3.exceptions.HTTPError as exc:
+        elapsed = time.monotonic() - start
+        logger.warning("Fetch failed url=%s error=%s seconds=%s", url, exc, round(elapsed, 2))
+        return False
+    _log_fetched(url, response.status, size, time.monotonic() - start)
+    return True
 
+
+def _read_remote_urllib(url: str, sink: Callable[[bytes], None], chunk_size: int) -> bool:
     request = urllib.request.Request(url, headers=REQUEST_HEADERS)
     start = time.monotonic()
     try:
         with urllib.request.urlopen(request, timeout=HTTP_TIMEOUT_SECONDS) as response:
-            body = response.read()
-            elapsed = time.monotonic() - start
-            logger.info(
-                "Fetched HTML url=%s status=%s bytes=%s seconds=%s",
-                url,
-                response.status,
-                len(body),
-                round(elapsed, 2),
-            )
-            return body.decode("utf-8", errors="replace")
+            size = 0
+            for chunk in iter(lambda: response.read(chunk_size), b""):
+                size += len(chunk)
+                sink(chunk)
+            _log_fetched(url, response.status, size, time.monotonic() - start)
+            return True
     except urllib.error.HTTPError as exc:
         elapsed = time.monotonic() - start
-        snippet = ""
+        snippet = b""
         try:
-            snippet = exc.read(500).decode("utf-8", errors="replace")
+            snippet = exc.read(500)
         except Exception:
-            snippet = ""
-        logger.warning(
-            "HTTP fetch failed url=%s status=%s reason=%s seconds=%s body_snippet=%s",
-            url,
-            exc.code,
-            exc.reason,
-            round(elapsed, 2),
-            snippet,
-        )
-        return None
+            snippet = b""
+        _log_http_error(url, exc.code, exc.reason, elapsed, snippet)
+        return False
     except (urllib.error.URLError, TimeoutError) as exc:
         elapsed = time.monotonic() - start
         logger.warning("Fetch failed url=%s error=%s seconds=%s", url, exc, round(elapsed, 2))
+        return False
+
+
+def _read_remote(url: str, sink: Callable[[bytes], None], chunk_size: int = HTTP_STREAM_CHUNK_BYTES) -> bool:
+    # Pushes the response body to sink chunk by chunk; False on any fetch failure.
+    pool = _get_pool()
+    if pool is not None:
+        return _read_remote_pooled(pool, url, sink, chunk_size)
+    return _read_remote_urllib(url, sink, chunk_size)
+
+
+def _local_path(url: str) -> Optional[Path]:
+    if url.startswith("file://"):
+        return Path(unquote(urlparse(url).path))
+    local_path = Path(url)
+    if local_path.exists():
+        return local_path
+    return None
+
+
+def fetch_html(url: str) -> Optional[str]:
+    local_path = _local_path(url)
+    if local_path is not None:
+        try:
+            body = local_path.read_bytes()
+        except OSError as exc:
+            logger.warning("Local file read failed path=%s error=%s", local_path, exc)
+            return None
+        logger.info("Loaded local HTML path=%s bytes=%s", local_path, len(body))
+        return body.decode("utf-8", errors="replace")
+
+    buffer = bytearray()
+    if not _read_remote(url, buffer.extend):
         return None
+    return buffer.decode("utf-8", errors="replace")
 
 
-def extract_company_names_from_html(html: str) -> List[str]:
+def stream_feed(url: str, parser: HTMLParser, chunk_size: int = HTTP_STREAM_CHUNK_BYTES) -> bool:
+    # Feeds the page to parser as it arrives instead of buffering the whole body first.
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    def feed(chunk: bytes) -> None:
+        parser.feed(decoder.decode(chunk))
+
+    local_path = _local_path(url)
+    if local_path is not None:
+        size = 0
+        try:
+            with local_path.open("rb") as handle:
+                for chunk in iter(lambda: handle.read(chunk_size), b""):
+                    size += len(chunk)
+                    feed(chunk)
+        except OSError as exc:
+            logger.warning("Local file read failed path=%s error=%s", local_path, exc)
+            return False
+        logger.info("Loaded local HTML path=%s bytes=%s", local_path, size)
+    elif not _read_remote(url, feed, chunk_size):
+        return False
+    parser.feed(decoder.decode(b"", final=True))
+    parser.close()
+    return True
+
+
+def _anchor_texts(html: str) -> List[str]:
+    if use_fast_parser():
+        tree = SelectolaxParser(html)
+        return [node.text(deep=True, separator=" ", strip=True) for node in tree.css("a")]
     parser = AnchorTextParser()
     parser.feed(html)
+    parser.close()
+    return parser.anchors
+
+
+def _anchor_links(html: str) -> List[tuple[str, str]]:
+    if use_fast_parser():
+        tree = SelectolaxParser(html)
+        links: List[tuple[str, str]] = []
+        for node in tree.css("a[href]"):
+            href = node.attributes.get("href") or ""
+            text = node.text(deep=True, separator=" ", strip=True)
+            if href and text:
+                links.append((text, href))
+        return links
+    parser = AnchorLinkParser()
+    parser.feed(html)
+    parser.close()
+    return parser.links
+
+
+def extract_company_names_from_html(html: str) -> List[str]:
     # Heuristic: company names are typically short anchor texts.
     names = []
-    for text in parser.anchors:
-        cleaned = re.sub(r"\s+", " ", text).strip()
+    for text in _anchor_texts(html):
+        if not (2 <= len(text) <= _RAW_ANCHOR_MAX):
+            continue
+        cleaned = " ".join(text.split())
         if 2 <= len(cleaned) <= 60:
             names.append(cleaned)
     # Deduplicate while preserving order.
@@ -144,19 +414,46 @@ def extract_company_names_from_html(html: str) -> List[str]:
     return unique
 
 
+def _anchor_links_regex(html: str) -> Optional[List[tuple[str, str]]]:
+    # Flat <a href="...">text</a> pages need no tokenizer at all. If any anchor is
+    # nested, href-less or otherwise irregular, return None so the parser handles it.
+    html = _A_SKIP_RE.sub(" ", html)
+    if _A_BAIL_RE.search(html):
+        return None
+    anchors = 0
+    for tag in _START_TAG_RE.finditer(html):
+        # A "<" inside an attribute value may hide markup the regex would misread.
+        if "<" in tag.group(2):
+            return None
+        if tag.group(1).lower() == "a":
+            anchors += 1
+    links: List[tuple[str, str]] = []
+    for match in _A_RE.finditer(html):
+        href = unescape(match.group(1))
+        text = unescape(match.group(2)).strip()
+        if href and text:
+            links.append((text, href))
+    if len(links) != anchors:
+        return None
+    return links
+
+
 def extract_company_entries_from_html(html: str) -> List[tuple[str, str]]:
-    parser = AnchorLinkParser()
-    parser.feed(html)
+    return _clean_entries(_anchor_links(html))
+
+
+def _clean_entries(links: List[tuple[str, str]]) -> List[tuple[str, str]]:
     entries: List[tuple[str, str]] = []
-    seen = set()
-    for text, href in parser.links:
-        cleaned = re.sub(r"\s+", " ", text).strip()
-        if not (2 <= len(cleaned) <= 60):
+    seen: set[str] = set()
+    for text, href in links:
+        if not href.startswith(_ALLOWED_SCHEMES):
             continue
-        if not href.startswith(("http://", "https://")):
+        if not (2 <= len(text) <= _RAW_ANCHOR_MAX):
             continue
-        key = cleaned.lower()
-        if key in seen:
+        cleaned = " ".join(text.split())
+        if not (2 <= len(cleaned) <= 60):
+            continue
+        if (key := cleaned.lower()) in seen:
             continue
         seen.add(key)
         entries.append((cleaned, href))
@@ -166,46 +463,61 @@ def extract_company_entries_from_html(html: str) -> List[tuple[str, str]]:
 class EIPPortfolioParser(HTMLParser):
     def __init__(self) -> None:
         super().__init__()
-        self._in_overlay = False
-        self._in_text = False
-        self._overlay_div_depth = 0
-        self._current_description: List[str] = []
+        self._in_overlay: bool = False
+        self._in_text: bool = False
+        self._overlay_div_depth: int = 0
+        self._current_description = io.StringIO()
+        self._text_run: List[str] = []
         self._current_site: str = ""
         self.entries: List[tuple[str, str]] = []
 
+    def _flush_text(self) -> None:
+        # A text node may arrive split across feed() chunks; strip it only once it is whole.
+        if self._text_run:
+            text = "".join(self._text_run).strip()
+            self._text_run = []
+            if text:
+                self._current_description.write(text)
+                self._current_description.write(" ")
+
     def handle_starttag(self, tag: str, attrs: List[tuple[str, Optional[str]]]) -> None:
-        attr_map = {k.lower(): (v or "") for k, v in attrs}
-        if tag.lower() == "div" and "portfolio-item-overlay" in attr_map.get("class", ""):
-            self._in_overlay = True
-            self._overlay_div_depth = 1
-            self._current_description = []
-            self._current_site = ""
-        elif self._in_overlay and tag.lower() == "div":
-            self._overlay_div_depth += 1
-        if self._in_overlay and tag.lower() == "div" and "text" in attr_map.get("class", ""):
-            self._in_text = True
-        if self._in_overlay and tag.lower() == "a" and "portfolio-site-url" in attr_map.get("class", ""):
-            href = attr_map.get("href", "")
-            if href:
+        self._flush_text()
+        if tag == "div":
+            css_class = get_attrs(attrs, "class")["class"]
+            # Match whole class tokens, as a CSS selector would: "text-large" is not "text".
+            classes = frozenset(css_class.split())
+            if "portfolio-item-overlay" in classes:
+                self._in_overlay = True
+                self._overlay_div_depth = 1
+                self._current_description.seek(0)
+                self._current_description.truncate()
+                self._current_site = ""
+            elif self._in_overlay:
+                self._overlay_div_depth += 1
+            if self._in_overlay and "text" in classes:
+                self._in_text = True
+        elif tag == "a" and self._in_overlay:
+            attr_map = get_attrs(attrs, "class", "href")
+            css_class, href = attr_map["class"], attr_map["href"]
+            if "portfolio-site-url" in css_class.split() and href:
                 self._current_site = href
 
     def handle_endtag(self, tag: str) -> None:
-        if self._in_overlay and tag.lower() == "div" and self._in_text:
+        self._flush_text()
+        if self._in_overlay and tag == "div" and self._in_text:
             self._in_text = False
-        if self._in_overlay and tag.lower() == "div":
+        if self._in_overlay and tag == "div":
             self._overlay_div_depth -= 1
             if self._overlay_div_depth > 0:
                 return
-            description = " ".join(self._current_description).strip()
+            description = self._current_description.getvalue().strip()
             if description or self._current_site:
                 self.entries.append((description, self._current_site))
             self._in_overlay = False
 
     def handle_data(self, data: str) -> None:
         if self._in_overlay and self._in_text:
-            text = data.strip()
-            if text:
-                self._current_description.append(text)
+            self._text_run.append(data)
 
 
 class SetVenturesParser(HTMLParser):
@@ -214,33 +526,100 @@ class SetVenturesParser(HTMLParser):
         self.entries: List[tuple[str, str]] = []
 
     def handle_starttag(self, tag: str, attrs: List[tuple[str, Optional[str]]]) -> None:
-        if tag.lower() != "a":
+        if tag != "a":
             return
-        attr_map = {k.lower(): (v or "") for k, v in attrs}
-        if "nectar-post-grid-link" in attr_map.get("class", ""):
-            name = attr_map.get("aria-label", "").strip()
-            href = attr_map.get("href", "").strip()
+        attr_map = get_attrs(attrs, "class", "aria-label", "href")
+        css_class, name, href = attr_map["class"], attr_map["aria-label"], attr_map["href"]
+        if "nectar-post-grid-link" in css_class.split():
+            name = name.strip()
+            href = href.strip()
             if name and href:
                 self.entries.append((name, href))
 
 
+def _eip_entries_fast(html: str) -> List[tuple[str, str]]:
+    tree = SelectolaxParser(html)
+    entries: List[tuple[str, str]] = []
+    for overlay in tree.css("div.portfolio-item-overlay"):
+        texts = [node.text(deep=True, separator=" ", strip=True) for node in overlay.css("div.text")]
+        description = " ".join(text for text in texts if text)
+        site = ""
+        for link in overlay.css("a.portfolio-site-url"):
+            site = link.attributes.get("href") or site
+        if description or site:
+            entries.append((description, site))
+    return entries
+
+
+def _setventures_entries_fast(html: str) -> List[tuple[str, str]]:
+    tree = SelectolaxParser(html)
+    entries: List[tuple[str, str]] = []
+    for link in tree.css("a.nectar-post-grid-link"):
+        name = (link.attributes.get("aria-label") or "").strip()
+        href = (link.attributes.get("href") or "").strip()
+        if name and href:
+            entries.append((name, href))
+    return entries
+
+
+def _read_entries(
+    url: str,
+    parser_factory: Callable[[], HTMLParser],
+    fast_extract: Callable[[str], List[tuple[str, str]]],
+) -> Optional[List[tuple[str, str]]]:
+    # None means the page could not be fetched; an empty list means nothing matched.
+    if use_fast_parser():
+        html = fetch_html(url)
+        if html is None:
+            return None
+        return fast_extract(html)
+    parser = parser_factory()
+    if not stream_feed(url, parser):
+        return None
+    return parser.entries
+
+
 def infer_company_name(description: str, website: str) -> str:
+    global _LAST_INFER
+    key = (description, website)
+    last = _LAST_INFER
+    if last is not None and last[0] == key:
+        return last[1]
+    name = _infer_company_name(description, website)
+    _LAST_INFER = (key, name)
+    return name
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_host(url: str) -> str:
+    if url.startswith(_ALLOWED_SCHEMES):
+        # Plain http(s)://host[:port]/... needs only a slice of the netloc.
+        start = url.find("//") + 2
+        end = len(url)
+        for sep in "/?#":
+            index = url.find(sep, start)
+            if index != -1 and index < end:
+                end = index
+        netloc = url[start:end]
+        if not _NETLOC_SLOW_RE.search(netloc):
+            return netloc.partition(":")[0].lower().removeprefix("www.")
+    try:
+        host = urlparse(url).hostname or ""
+    except ValueError:
+        return ""
+    return host.removeprefix("www.")
+
+
+def _infer_company_name(description: str, website: str) -> str:
     if description:
-        match = re.match(r"^([A-Z][A-Za-z0-9&.+-]*(?:\s+[A-Z][A-Za-z0-9&.+-]*){0,3})[’']s\b", description)
+        match = _NAME_POSSESSIVE_RE.match(description)
         if match:
             return match.group(1).strip()
-        match = re.search(
-            r"\b([A-Z][A-Za-z0-9&.+-]*(?:\s+[A-Z][A-Za-z0-9&.+-]*){0,3})\s+(is|are|provides|develops|builds|offers|delivers|enables)\b",
-            description,
-        )
+        match = _NAME_VERB_RE.search(description)
         if match:
             return match.group(1).strip()
     if website:
-        try:
-            host = urlparse(website).hostname or ""
-        except ValueError:
-            host = ""
-        host = host.replace("www.", "")
+        host = _parse_host(website)
         if host:
             primary = host.split(".")[0]
             return primary.replace("-", " ").replace("_", " ").title()
@@ -259,32 +638,113 @@ def build_company_from_name(name: str, source: str, website: str = "", descripti
     )
 
 
+def clear_scrape_cache() -> None:
+    with _SCRAPE_CACHE_LOCK:
+        _SCRAPE_CACHE.clear()
+
+
 def scrape_portfolio(url: str, source: str, fallback: List[Company]) -> List[Company]:
+    key = (url, source)
+    with _SCRAPE_CACHE_LOCK:
+        cached = _SCRAPE_CACHE.get(key)
+        if cached is not None:
+            _SCRAPE_CACHE.move_to_end(key)
+    if cached is None:
+        companies = _scrape_portfolio(url, source)
+        if not companies:
+            return fallback
+        cached = tuple(companies)
+        with _SCRAPE_CACHE_LOCK:
+            _SCRAPE_CACHE[key] = cached
+            if len(_SCRAPE_CACHE) > _SCRAPE_CACHE_MAXSIZE:
+                _SCRAPE_CACHE.popitem(last=False)
+    # Enrichment mutates companies in place, so callers always get fresh copies.
+    return [dataclasses.replace(company) for company in cached]
+
+
+def scrape_portfolios(
+    specs: List[tuple[str, str, List[Company]]],
+    max_workers: int = SCRAPE_CONCURRENCY,
+) -> dict[tuple[str, str], List[Company]]:
+    if len(specs) <= 1:
+        return {(url, source): scrape_portfolio(url, source, fallback) for url, source, fallback in specs}
+    # Workers share the urllib3 pool; never run more than it keeps connections for.
+    workers = min(max_workers, HTTP_POOL_MAXSIZE, len(specs))
+    logger.info("Scraping %s portfolio pages workers=%s", len(specs), workers)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            (url, source): executor.submit(scrape_portfolio, url, source, fallback)
+            for url, source, fallback in specs
+        }
+        return {key: future.result() for key, future in futures.items()}
+
+
+def _scrape_eip(url: str, source: str) -> List[Company]:
+    entries = _read_entries(url, EIPPortfolioParser, _eip_entries_fast)
+    if entries is None:
+        return []
+    companies = []
+    for description, website in entries:
+        name = infer_company_name(description, website)
+        companies.append(build_company_from_name(name, source, website, description))
+    return companies
+
+
+def _scrape_setventures(url: str, source: str) -> List[Company]:
+    entries = _read_entries(url, SetVenturesParser, _setventures_entries_fast)
+    if entries is None:
+        return []
+    companies = []
+    for name, profile_url in entries:
+        clean_name = name.title() if name.isupper() else name
+        companies.append(build_company_from_name(clean_name, source, profile_url=profile_url))
+    return companies
+
+
+def _scrape_generic(url: str, source: str) -> List[Company]:
     html = fetch_html(url)
     if not html:
-        return fallback
-    if "energyimpactpartners.com" in url:
-        parser = EIPPortfolioParser()
-        parser.feed(html)
-        companies = []
-        for description, website in parser.entries:
-            name = infer_company_name(description, website)
-            companies.append(build_company_from_name(name, source, website, description))
-        return companies or fallback
-
-    if "setventures.com" in url:
-        parser = SetVenturesParser()
-        parser.feed(html)
-        companies = []
-        for name, profile_url in parser.entries:
-            clean_name = name.title() if name.isupper() else name
-            companies.append(build_company_from_name(clean_name, source, profile_url=profile_url))
-        return companies or fallback
-
-    entries = extract_company_entries_from_html(html)
+        return []
+    # selectolax beats the regex scan; the scan only pays off over the HTMLParser fallback.
+    links = None if use_fast_parser() else _anchor_links_regex(html)
+    entries = extract_company_entries_from_html(html) if links is None else _clean_entries(links)
     if entries:
         return [build_company_from_name(name, source, website) for name, website in entries]
     names = extract_company_names_from_html(html)
-    if not names:
-        return fallback
     return [build_company_from_name(name, source) for name in names]
+
+
+# Site-specific scrapers by hostname; anything else (including local files) is generic.
+_SCRAPERS: dict[str, Callable[[str, str], List[Company]]] = {
+    "energyimpactpartners.com": _scrape_eip,
+    "www.energyimpactpartners.com": _scrape_eip,
+    "setventures.com": _scrape_setventures,
+    "www.setventures.com": _scrape_setventures,
+}
+
+
+def _dedup_key(company: Company) -> bytes:
+    host = _parse_host(company.website)
+    if host:
+        key = f"{company.name_key}|{host}"
+    else:
+        # Without a host the name may be an "Unknown" fallback; only exact repeats match.
+        key = f"{company.name_key}||{company.profile_url}|{company.description}"
+    return hashlib.blake2b(key.encode(), digest_size=8).digest()
+
+
+def _dedup_companies(companies: List[Company]) -> List[Company]:
+    # A page can list the same company more than once; keep the first occurrence.
+    seen: set[bytes] = set()
+    unique: List[Company] = []
+    for company in companies:
+        if (key := _dedup_key(company)) in seen:
+            continue
+        seen.add(key)
+        unique.append(company)
+    return unique
+
+
+def _scrape_portfolio(url: str, source: str) -> List[Company]:
+    host = (urlparse(url).hostname or "").lower()
+    return _dedup_companies(_SCRAPERS.get(host, _scrape_generic)(url, source))